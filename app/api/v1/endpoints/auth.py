@@ -37,7 +37,7 @@ get_auth_service = get_service(AuthService)
     summary="Create a new user",
     description="Create a new user account with email, username, and password validation.",
 )
-async def create_user(
+def create_user(
     user_data: UserCreate,
     auth_service: AuthService = Depends(get_auth_service),
 ):
@@ -69,7 +69,7 @@ async def create_user(
     summary="Authenticate user",
     description="Authenticate a user with email and password.",
 )
-async def authenticate_user(
+def authenticate_user(
     login_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service),
 ):
@@ -100,7 +100,7 @@ async def authenticate_user(
     summary="Change user password",
     description="Change a user's password after verifying the current password.",
 )
-async def change_password(
+def change_password(
     password_data: UserChangePassword,
     auth_service: AuthService = Depends(get_auth_service),
 ):
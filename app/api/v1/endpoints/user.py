@@ -1,5 +1,6 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from app.api.__deps import get_service
 from app.config.database import get_db
 from app.services.user_service import UserService
@@ -10,7 +11,7 @@ from app.schemas.user import (
     UserFilters,
     UserBulkUpdate,
 )
-from app.schemas.common import PaginatedResponse, PaginationRequest
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse, PaginationRequest
 from app.utils.exceptions import (
     UserAlreadyExistsError,
     UserNotFoundError,
@@ -22,6 +23,10 @@ from app.utils.response_docs import ResponseDocs
 
 users_router = APIRouter(prefix="/users", tags=["Users"])
 
+# Shared serializer for the hot active-users list; dumping through it skips
+# the per-row response_model re-validation FastAPI would otherwise do
+_user_list_adapter = TypeAdapter(List[UserResponse])
+
 
 get_user_service = get_service(UserService)
 
@@ -36,7 +41,7 @@ get_user_service = get_service(UserService)
     summary="Get user by ID",
     description="Retrieve a specific user by their ID.",
 )
-async def get_user(
+def get_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -65,7 +70,7 @@ async def get_user(
     summary="Get user by email",
     description="Retrieve a user by their email address.",
 )
-async def get_user_by_email(
+def get_user_by_email(
     email: str,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -94,7 +99,7 @@ async def get_user_by_email(
     summary="Get user by username",
     description="Retrieve a user by their username.",
 )
-async def get_user_by_username(
+def get_user_by_username(
     username: str,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -125,7 +130,7 @@ async def get_user_by_username(
     summary="Get user with tasks",
     description="Retrieve a user along with their associated tasks.",
 )
-async def get_user_with_tasks(
+def get_user_with_tasks(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -156,7 +161,7 @@ async def get_user_with_tasks(
     summary="Get all users",
     description="Retrieve all users with basic pagination.",
 )
-async def get_all_users(
+def get_all_users(
     skip: int = Query(0, ge=0, description="Number of users to skip"),
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of users to return"
@@ -192,7 +197,7 @@ async def get_all_users(
     summary="Get users with advanced pagination",
     description="Retrieve users with advanced pagination and filtering options.",
 )
-async def get_users_paginated(
+def get_users_paginated(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(
         10, ge=1, le=100, description="Maximum number of users to return per page"
@@ -243,6 +248,47 @@ async def get_users_paginated(
         )
 
 
+@users_router.get(
+    "/cursor/list",
+    responses={
+        200: ResponseDocs.success_200(
+            CursorPaginatedResponse[UserResponse],
+            "Users with cursor pagination retrieved successfully.",
+        ),
+        401: ResponseDocs.unauthorized_401(),
+        **ResponseDocs.standard_responses(include_auth=False, resource_name="User"),
+    },
+    summary="Get users with cursor pagination",
+    description="Retrieve users with keyset (cursor) pagination; efficient for deep pages.",
+)
+def get_users_cursor(
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from a previous page (omit for the first page)"
+    ),
+    limit: int = Query(
+        10, ge=1, le=100, description="Maximum number of users to return per page"
+    ),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    user_service: UserService = Depends(get_user_service),
+):
+    """
+    Get users with keyset (cursor) pagination.
+
+    - **cursor**: Opaque cursor returned as `next_cursor` by the previous page
+    - **limit**: Maximum number of users to return per page (default: 10, max: 100)
+    - **is_active**: Filter by active status
+    """
+    try:
+        filters = UserFilters(is_active=is_active)
+        return user_service.get_users_cursor(cursor=cursor, limit=limit, filters=filters)
+    except AppValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
 @users_router.put(
     "/{user_id}",
     responses={
@@ -253,7 +299,7 @@ async def get_users_paginated(
     summary="Update user",
     description="Update user information by ID.",
 )
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdate,
     user_service: UserService = Depends(get_user_service),
@@ -288,7 +334,7 @@ async def update_user(
     summary="Delete user",
     description="Soft delete a user by ID.",
 )
-async def delete_user(
+def delete_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -315,7 +361,7 @@ async def delete_user(
     summary="Bulk update users",
     description="Update multiple users at once.",
 )
-async def bulk_update_users(
+def bulk_update_users(
     bulk_data: UserBulkUpdate,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -349,7 +395,7 @@ async def bulk_update_users(
     summary="Get user count",
     description="Get the total count of users with optional filters.",
 )
-async def get_user_count(
+def get_user_count(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     email_contains: Optional[str] = Query(
         None, description="Filter by email containing text"
@@ -394,7 +440,7 @@ async def get_user_count(
     summary="Check if user exists",
     description="Check if a user exists by ID.",
 )
-async def check_user_exists(
+def check_user_exists(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -418,7 +464,7 @@ async def check_user_exists(
     summary="Check if email exists",
     description="Check if an email address is already taken.",
 )
-async def check_email_exists(
+def check_email_exists(
     email: str,
     exclude_id: Optional[int] = Query(
         None, description="User ID to exclude from check"
@@ -441,7 +487,7 @@ async def check_email_exists(
     summary="Check if username exists",
     description="Check if a username is already taken.",
 )
-async def check_username_exists(
+def check_username_exists(
     username: str,
     exclude_id: Optional[int] = Query(
         None, description="User ID to exclude from check"
@@ -463,18 +509,28 @@ async def check_username_exists(
 
 @users_router.get(
     "/active/list",
-    response_model=List[UserResponse],
+    responses={
+        200: ResponseDocs.success_200(
+            List[UserResponse], "Active users retrieved successfully."
+        ),
+    },
     summary="Get active users",
     description="Retrieve all active users.",
 )
-async def get_active_users(
+def get_active_users(
     user_service: UserService = Depends(get_user_service),
 ):
     """
     Get all active users.
     """
     try:
-        return user_service.get_active_users()  # User-specific method
+        users = user_service.get_active_users()  # User-specific method
+        # Already-converted schemas: serialize directly instead of letting
+        # FastAPI validate each row against a response_model again
+        return Response(
+            content=_user_list_adapter.dump_json(users),
+            media_type="application/json",
+        )
     except ServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -487,7 +543,7 @@ async def get_active_users(
     summary="Activate user",
     description="Activate a user account.",
 )
-async def activate_user(
+def activate_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -512,7 +568,7 @@ async def activate_user(
     summary="Deactivate user",
     description="Deactivate a user account.",
 )
-async def deactivate_user(
+def deactivate_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
 ):
@@ -5,8 +5,13 @@ from .settings import settings
 
 # Create SQLite engine
 engine = create_engine(
-    settings.DATABASE_URL,                    # Database URL (e.g. sqlite:///./test.db)
-    connect_args={"check_same_thread": False} # SQLite-specific argument to allow use with multiple threads
+    settings.DATABASE_URL,                     # Database URL (e.g. sqlite:///./test.db)
+    connect_args={"check_same_thread": False}, # SQLite-specific argument to allow use with multiple threads
+    pool_size=20,       # Keep up to 20 connections open (default of 5 stalls under concurrent requests)
+    max_overflow=10,    # Allow 10 extra short-lived connections during bursts
+    pool_timeout=30,    # Seconds to wait for a free connection before raising
+    pool_pre_ping=True, # Check connections on checkout so stale ones are recycled, not surfaced as errors
+    query_cache_size=1200, # Compiled-SQL cache wide enough to keep all repository statements hot (default 500)
 )
 
 # Create a configured "Session" class
@@ -1,5 +1,5 @@
 # Import required SQLAlchemy classes
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Index
 from sqlalchemy.orm import relationship
 
 # Import your custom base model that inherits from declarative_base()
@@ -10,6 +10,11 @@ from .base import BaseModel
 class User(BaseModel):
     __tablename__ = "users"  # Explicitly sets the table name to "users"
 
+    __table_args__ = (
+        # Composite index backing keyset pagination on (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
     # --------------------
     # Fields / Columns
     # --------------------
@@ -1,13 +1,13 @@
 from typing import Generic, TypeVar, Type, Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, tuple_, update
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
 import logging
 
 from pydantic import BaseModel
 from app.models import BaseModel as GeneralBaseModel
-from app.schemas.common import PaginatedResponse, PaginationRequest
 from app.utils.exceptions import DatabaseError
 # Define type variables to be used with generics
 ModelType = TypeVar("ModelType", bound=GeneralBaseModel)       # SQLAlchemy model type
@@ -26,6 +26,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
         self.db = db
+        # Resolved once per repository: hasattr on mapped classes/instances
+        # goes through SQLAlchemy's instrumented descriptors, so don't pay
+        # for that reflection on every query
+        self._has_soft_delete = "deleted_at" in model.__mapper__.columns
 
     @contextmanager
     def transaction(self):
@@ -46,7 +50,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             """Get one record by its primary key id."""
             try:
                 query = self.db.query(self.model).filter(self.model.id == id)
-                if hasattr(self.model, "deleted_at"):
+                if self._has_soft_delete:
                     query = query.filter(self.model.deleted_at.is_(None))
                 return query.first()
             except SQLAlchemyError as e:
@@ -55,13 +59,17 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             
         # Execute the query and return the first matching record or None if not found
 
-    def get_multi(self, skip: int = 0, limit: int = 100, **filters) -> List[ModelType]:
+    def get_multi(self, skip: int = 0, limit: int = 100, columns: Optional[Tuple] = None, **filters) -> List[ModelType]:
         """
         Get multiple records with optional filters, skipping and limiting results.
         Excludes soft-deleted records.
+        When 'columns' is given, only those attributes are loaded (plus the
+        primary key); heavy columns the response never reads stay off the wire.
         """
         query = self.db.query(self.model)
-        if hasattr(self.model, "deleted_at"):
+        if columns:
+            query = query.options(load_only(*columns))
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         # Apply dynamic filters passed in as a dictionary called 'filters'
         # Loop through each key-value pair in the filters dictionary
@@ -86,7 +94,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Get all records (excluding soft-deleted if applicable).
         """
         query = self.db.query(self.model)
-        if hasattr(self.model, "deleted_at"):
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         return query.all()
 
@@ -97,7 +105,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not hasattr(self.model, field):
             return None
         query = self.db.query(self.model).filter(getattr(self.model, field) == value)
-        if hasattr(self.model, "deleted_at"):
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         return query.first()
 
@@ -108,7 +116,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not hasattr(self.model, field):
             return []
         query = self.db.query(self.model).filter(getattr(self.model, field) == value)
-        if hasattr(self.model, "deleted_at"):
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         return query.all()
 
@@ -117,7 +125,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Get multiple records by a list of ids.
         """
         query = self.db.query(self.model).filter(self.model.id.in_(ids))
-        if hasattr(self.model, "deleted_at"):
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         return query.all()
 
@@ -227,7 +235,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         with self.transaction():
             obj = self.db.query(self.model).filter(self.model.id == id).first()
-            if obj and hasattr(obj, "deleted_at"):
+            if obj and self._has_soft_delete:
                 obj.deleted_at = datetime.now(timezone.utc)
                 self.db.add(obj)
                 self.db.flush()
@@ -248,10 +256,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Check if a record exists by id (excluding soft deleted).
         """
-        query = self.db.query(self.model).filter(self.model.id == id)
-        if hasattr(self.model, "deleted_at"):
+        query = self.db.query(self.model.id).filter(self.model.id == id)
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
-        return query.first() is not None
+        return query.limit(1).first() is not None
 
     def exists_by_field(self, field: str, value: Any) -> bool:
         """
@@ -259,17 +267,17 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         if not hasattr(self.model, field):
             return False
-        query = self.db.query(self.model).filter(getattr(self.model, field) == value)
-        if hasattr(self.model, "deleted_at"):
+        query = self.db.query(self.model.id).filter(getattr(self.model, field) == value)
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
-        return query.first() is not None
+        return query.limit(1).first() is not None
 
     def count(self, **filters) -> int:
         """
         Count total records matching optional filters (excluding soft deleted).
         """
         query = self.db.query(self.model)
-        if hasattr(self.model, "deleted_at"):
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         for field, value in filters.items():
             if hasattr(self.model, field) and value is not None:
@@ -288,59 +296,95 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not updates:
             return 0
 
+        # Group rows by their field set so each group runs as one executemany
+        # batch (a single prepared UPDATE with N parameter sets) instead of
+        # one round trip per row
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for update_data in updates:
+            if 'id' not in update_data:
+                continue
+            fields = frozenset(update_data) - {'id'}
+            if not fields:
+                continue
+            groups.setdefault(fields, []).append(update_data)
+
         with self.transaction():
             updated_count = 0
-            for update_data in updates:
-                if 'id' not in update_data:
-                    continue
-
-                obj_id = update_data.pop('id')
-                result = self.db.query(self.model).filter(self.model.id == obj_id).update(update_data)
-                updated_count += result
+            for fields, rows in groups.items():
+                # One prepared UPDATE per field set, executed via Core
+                # executemany on the session's connection (the ORM path would
+                # raise StaleDataError for ids that match no row, which this
+                # method has always silently skipped)
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == bindparam('b_id'))
+                    .values({field: bindparam(field) for field in fields})
+                )
+                params = [
+                    {'b_id': row['id'], **{field: row[field] for field in fields}}
+                    for row in rows
+                ]
+                result = self.db.connection().execute(stmt, params)
+                updated_count += result.rowcount
 
             return updated_count
 
 
-    def get_with_pagination(self, skip: int = 0, limit: int = 10, **filters) -> Tuple[List[ModelType], int]:
+    def get_with_pagination(
+        self, skip: int = 0, limit: int = 10, columns: Optional[Tuple] = None, **filters
+    ) -> Tuple[List[ModelType], int]:
         """
         Get records with pagination and optional filters.
         Returns a tuple: (list of items, total count).
+
+        The total is computed with a COUNT(*) OVER () window column on the same
+        query, so rows and total come back in a single round trip instead of a
+        separate SELECT COUNT(*). An optional 'columns' tuple restricts which
+        attributes are loaded.
         """
-        query = self.db.query(self.model)
-        if hasattr(self.model, "deleted_at"):
+        query = self.db.query(self.model, func.count().over().label("total"))
+        if columns:
+            query = query.options(load_only(*columns))
+        if self._has_soft_delete:
             query = query.filter(self.model.deleted_at.is_(None))
         for field, value in filters.items():
             if hasattr(self.model, field) and value is not None:
                 query = query.filter(getattr(self.model, field) == value)
-        total = query.count()
-        items = query.offset(skip).limit(limit).all()
+        rows = query.offset(skip).limit(limit).all()
+        if rows:
+            items = [row[0] for row in rows]
+            total = rows[0][1]
+        else:
+            # Page past the end (or no matches): no window row came back,
+            # so fall back to a plain count for the total.
+            items = []
+            total = query.with_entities(func.count()).scalar() or 0
         return items, total
     
     
-    def get_paginated_response(self, pagination: PaginationRequest, **filters) -> PaginatedResponse:
+    def get_with_cursor(
+        self,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 10,
+        columns: Optional[Tuple] = None,
+        **filters
+    ) -> List[ModelType]:
         """
-        Get paginated response with enhanced pagination metadata.
-        
-        Args:
-            pagination: Pagination request parameters
-            **filters: Additional filter parameters
-            
-        Returns:
-            PaginatedResponse with items and pagination metadata
+        Get records with keyset (cursor) pagination, newest first.
+
+        Unlike OFFSET pagination, the database only scans from the cursor
+        position onwards, so deep pages stay O(limit) instead of O(offset).
+        The cursor is the (created_at, id) pair of the last row of the
+        previous page; rows strictly before it are returned.
         """
-        skip = (pagination.page - 1) * pagination.limit
-        items, total = self.get_with_pagination(skip=skip, limit=pagination.limit, **filters)
-        
-        total_pages = (total + pagination.limit - 1) // pagination.limit
-        has_next = pagination.page < total_pages
-        has_previous = pagination.page > 1
-        
-        return PaginatedResponse(
-            items=items,
-            page=pagination.page,
-            limit=pagination.limit,
-            total=total,
-            total_pages=total_pages,
-            has_next=has_next,
-            has_previous=has_previous
-        )
+        query = self.db.query(self.model)
+        if columns:
+            query = query.options(load_only(*columns))
+        if self._has_soft_delete:
+            query = query.filter(self.model.deleted_at.is_(None))
+        for field, value in filters.items():
+            if hasattr(self.model, field) and value is not None:
+                query = query.filter(getattr(self.model, field) == value)
+        if cursor is not None:
+            query = query.filter(tuple_(self.model.created_at, self.model.id) < cursor)
+        return query.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit).all()
@@ -1,5 +1,6 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session, load_only, selectinload
+from typing import Any, Dict, List, Optional, Tuple
 from app.repositories.base import BaseRepository
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -9,28 +10,141 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     def __init__(self, db: Session):
         super().__init__(User, db)
 
+    def _request_cache(self) -> Dict:
+        """
+        Memo for repeated lookups within one request, stored on the session
+        (sessions are per-request, so entries never outlive it).
+        Signup and auth flows probe the same email/username several times;
+        this turns the repeats into dict hits instead of SELECTs.
+        """
+        return self.db.info.setdefault('user_cache', {})
+
+    def clear_request_cache(self) -> None:
+        """Drop memoized lookups after a write so later reads see fresh rows."""
+        self.db.info.get('user_cache', {}).clear()
+
+    def get_with_tasks(self, id: int) -> Optional[User]:
+        """Get a user by id with their tasks eagerly loaded (avoids N+1 lazy loads)."""
+        return (
+            self.db.query(User)
+            .options(selectinload(User.tasks))
+            .filter(User.id == id, User.deleted_at.is_(None))
+            .first()
+        )
+
     def get_by_email(self, email: str) -> Optional[User]:
-        """Get a user by their email."""
-        return self.db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
+        """Get a user by their email (memoized per request)."""
+        cache = self._request_cache()
+        key = ('email', email)
+        if key not in cache:
+            cache[key] = self.db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
+        return cache[key]
 
     def get_by_username(self, username: str) -> Optional[User]:
-        """Get a user by their username."""
-        return self.db.query(User).filter(User.username == username, User.deleted_at.is_(None)).first()
+        """Get a user by their username (memoized per request)."""
+        cache = self._request_cache()
+        key = ('username', username)
+        if key not in cache:
+            cache[key] = self.db.query(User).filter(User.username == username, User.deleted_at.is_(None)).first()
+        return cache[key]
 
     def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
         """Check if a user exists with the given email, excluding a specific user ID."""
-        query = self.db.query(User).filter(User.email == email, User.deleted_at.is_(None))
-        if exclude_id:
-            query = query.filter(User.id != exclude_id)
-        return query.first() is not None
+        cache = self._request_cache()
+        key = ('exists_email', email, exclude_id)
+        if key not in cache:
+            query = self.db.query(User.id).filter(User.email == email, User.deleted_at.is_(None))
+            if exclude_id:
+                query = query.filter(User.id != exclude_id)
+            cache[key] = query.limit(1).first() is not None
+        return cache[key]
 
     def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
         """Check if a user exists with the given username, excluding a specific user ID."""
-        query = self.db.query(User).filter(User.username == username, User.deleted_at.is_(None))
+        cache = self._request_cache()
+        key = ('exists_username', username, exclude_id)
+        if key not in cache:
+            query = self.db.query(User.id).filter(User.username == username, User.deleted_at.is_(None))
+            if exclude_id:
+                query = query.filter(User.id != exclude_id)
+            cache[key] = query.limit(1).first() is not None
+        return cache[key]
+
+    def check_uniqueness(
+        self, email: str, username: str, exclude_id: Optional[int] = None
+    ) -> Tuple[bool, bool]:
+        """
+        Probe email and username availability with one round-trip.
+        Returns (email_taken, username_taken) from a single
+        SELECT EXISTS(...), EXISTS(...) query instead of two probes.
+        """
+        email_q = select(User.id).where(User.email == email, User.deleted_at.is_(None))
+        username_q = select(User.id).where(User.username == username, User.deleted_at.is_(None))
         if exclude_id:
-            query = query.filter(User.id != exclude_id)
-        return query.first() is not None
+            email_q = email_q.where(User.id != exclude_id)
+            username_q = username_q.where(User.id != exclude_id)
+        row = self.db.execute(
+            select(email_q.exists().label("email_taken"), username_q.exists().label("username_taken"))
+        ).one()
+        return bool(row.email_taken), bool(row.username_taken)
+
+    def update_with_conflict_check(self, id: int, fields: Dict[str, Any]) -> Optional[User]:
+        """
+        Update a user with existence and unique-conflict checks folded into a
+        single UPDATE ... WHERE ... RETURNING statement instead of separate
+        SELECTs. NOT EXISTS guards block the update when the new email or
+        username is already taken by another live user.
+        Returns the updated user, or None if the row was missing, soft
+        deleted, or blocked by a conflict (callers discriminate afterwards).
+        """
+        if not fields:
+            return self.get(id)
+        conditions = [User.id == id, User.deleted_at.is_(None)]
+        for field in ('email', 'username'):
+            if field in fields:
+                column = getattr(User, field)
+                conditions.append(
+                    ~exists().where(
+                        column == fields[field],
+                        User.id != id,
+                        User.deleted_at.is_(None),
+                    )
+                )
+        with self.transaction():
+            stmt = (
+                update(User)
+                .where(*conditions)
+                .values(**fields)
+                .returning(User)
+                .execution_options(synchronize_session=False)
+            )
+            updated = self.db.scalars(stmt).first()
+            self.clear_request_cache()
+            return updated
+
+    def bulk_update_same(self, ids: List[int], fields: Dict[str, Any]) -> int:
+        """
+        Apply the same field values to many users with a single
+        UPDATE ... WHERE id IN (...) statement.
+        Returns the number of rows updated.
+        """
+        if not ids or not fields:
+            return 0
+        with self.transaction():
+            result = self.db.execute(
+                update(User)
+                .where(User.id.in_(ids), User.deleted_at.is_(None))
+                .values(**fields)
+                .execution_options(synchronize_session=False)
+            )
+            self.clear_request_cache()
+            return result.rowcount
 
     def get_active_users(self) -> List[User]:
-        """Retrieve all active users."""
-        return self.db.query(User).filter(User.is_active.is_(True), User.deleted_at.is_(None)).all()
+        """Retrieve all active users, loading only the response columns."""
+        return (
+            self.db.query(User)
+            .options(load_only(User.email, User.username, User.is_active))
+            .filter(User.is_active.is_(True), User.deleted_at.is_(None))
+            .all()
+        )
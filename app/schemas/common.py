@@ -22,6 +22,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset (cursor) paginated response schema."""
+    items: List[T]
+    limit: int = Field(..., description="Limit per page")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page, if any")
+    has_next: bool = Field(..., description="Whether there are more pages")
+
+
 class SuccessResponseSchema(BaseModel):
     """
     Standard schema for successful HTTP responses.
@@ -1,9 +1,21 @@
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from app.schemas.common import PaginatedResponse
 from app.schemas.task import TaskResponse
 
+# Compiled once at import; usernames repeat often (filters, admin UIs), so the
+# pure string -> bool check is also memoized instead of re-matched per request.
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_username(value: str) -> bool:
+    return _USERNAME_RE.match(value) is not None
+
+
 class UserBase(BaseModel):
     email: EmailStr = Field(..., description="User Email")
     username: str = Field(..., max_length=50, min_length=3)
@@ -20,7 +32,7 @@ class UserCreate(UserBase):
     
     @field_validator('username')
     def validate_username(cls, v):
-        if not v.isalnum() and '_' not in v:
+        if not _is_valid_username(v):
             raise ValueError('Username must contain only alphanumeric characters and underscores')
         return v.lower()
     
@@ -40,7 +52,7 @@ class UserUpdate(BaseModel):
     
     @field_validator('username')
     def validate_username(cls, v):
-        if v is not None and not v.isalnum() and '_' not in v:
+        if v is not None and not _is_valid_username(v):
             raise ValueError('Username must contain only alphanumeric characters and underscores')
         return v.lower() if v else v
 
@@ -50,10 +62,12 @@ class UserResponse(BaseModel):
     username: str = Field(..., max_length=50, min_length=3)
     is_active: bool = Field(..., description="Is user active")
 
-    class Config:
-        from_attributes = True
-        
-        
+    # Responses are read-only views; frozen skips the mutation machinery and
+    # lets validation avoid defensive copies of nested task lists
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+
 class UserWithTasksResponse(UserResponse):
     tasks: List[TaskResponse] = Field(default=[], description="User tasks")
 
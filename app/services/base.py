@@ -34,22 +34,27 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
     """
     
     def __init__(
-        self, 
+        self,
         repository: BaseRepository[ModelType, CreateSchemaType, UpdateSchemaType],
         response_schema: Type[ResponseSchemaType],
-        entity_name: str
+        entity_name: str,
+        response_columns: Optional[tuple] = None
     ):
         """
         Initialize base service.
-        
+
         Args:
             repository: Repository instance for database operations
             response_schema: Pydantic schema for response serialization
             entity_name: Name of the entity (for error messages and logging)
+            response_columns: Optional tuple of model attributes to project in
+                list queries; columns the response schema never reads are then
+                deferred instead of transferred per row
         """
         self.repository = repository
         self.response_schema = response_schema
         self.entity_name = entity_name
+        self.response_columns = response_columns
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def get_by_id(self, entity_id: int) -> ResponseSchemaType:
@@ -77,7 +82,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
             
             self.logger.debug(f"Fetching {self.entity_name}s with skip={skip}, limit={limit}")
             
-            entities = self.repository.get_multi(skip=skip, limit=limit)
+            entities = self.repository.get_multi(skip=skip, limit=limit, columns=self.response_columns)
             
             self.logger.debug(f"Retrieved {len(entities)} {self.entity_name}s")
             return [self.response_schema.model_validate(entity) for entity in entities]
@@ -96,25 +101,30 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         """Get entities with enhanced pagination."""
         try:
             self.logger.debug(f"Fetching paginated {self.entity_name}s: page={pagination.page}, limit={pagination.limit}")
-            
-            # Get paginated response from repository
-            paginated_response = self.repository.get_paginated_response(pagination, **filters)
-            
+
+            # Fetch rows + total directly; metadata math is done inline so the
+            # PaginatedResponse is validated once, not rebuilt from an
+            # intermediate response object
+            skip = (pagination.page - 1) * pagination.limit
+            items, total = self.repository.get_with_pagination(
+                skip=skip, limit=pagination.limit, columns=self.response_columns, **filters
+            )
+
             # Convert items to response schema
             response_items = [
-                self.response_schema.model_validate(item) 
-                for item in paginated_response.items
+                self.response_schema.model_validate(item)
+                for item in items
             ]
-            
-            # Create new paginated response with converted items
+
+            total_pages = (total + pagination.limit - 1) // pagination.limit
             result = PaginatedResponse[ResponseSchemaType](
                 items=response_items,
-                page=paginated_response.page,
-                limit=paginated_response.limit,
-                total=paginated_response.total,
-                total_pages=paginated_response.total_pages,
-                has_next=paginated_response.has_next,
-                has_previous=paginated_response.has_previous
+                page=pagination.page,
+                limit=pagination.limit,
+                total=total,
+                total_pages=total_pages,
+                has_next=pagination.page < total_pages,
+                has_previous=pagination.page > 1
             )
             
             self.logger.debug(f"Retrieved {len(response_items)} {self.entity_name}s (page {pagination.page})")
@@ -246,8 +256,14 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
 
     def _prepare_update_data(self, update_data: UpdateSchemaType) -> Dict[str, Any]:
         """Prepare data for update. Override in subclasses if needed."""
-        if hasattr(update_data, 'model_dump'):
-            data = update_data.model_dump(exclude_unset=True, exclude_none=True)
+        if hasattr(update_data, 'model_fields_set'):
+            # Only walk the fields the client explicitly set instead of
+            # serializing the whole model and discarding the unset ones
+            data = {
+                field: value
+                for field in update_data.model_fields_set
+                if (value := getattr(update_data, field)) is not None
+            }
         else:
             data = dict(update_data) if isinstance(update_data, dict) else update_data
         
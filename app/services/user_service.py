@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
+import base64
+import json
 import logging
+import time
+from array import array
 
 from app.repositories.user_repository import UserRepository
 from app.services.base import BaseService
@@ -15,16 +19,60 @@ from app.schemas.user import (
     UserFilters,
     UserBulkUpdate,
 )
-from app.schemas.common import PaginatedResponse, PaginationRequest
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse, PaginationRequest
 from app.utils.exceptions import (
-    UserAlreadyExistsError, 
+    UserAlreadyExistsError,
     UserNotFoundError,
     AppValidationError,
+    DatabaseError,
+    NotFoundError,
     ServiceError,
 )
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import: hasattr on mapped instances runs SQLAlchemy's
+# instrumented-attribute machinery, so the schema capability is checked
+# against the mapper instead of per delete call
+_HAS_IS_ADMIN = "is_admin" in User.__mapper__.columns
+
+# User counts back every paginated list render but barely move within a few
+# seconds, so cache them briefly, keyed on the filter set. Shared across
+# requests (service instances are per-request); writes clear it.
+_COUNT_CACHE: Dict[Tuple, Tuple[float, int]] = {}
+_COUNT_CACHE_TTL = 5.0   # seconds
+_COUNT_CACHE_MAX = 256   # distinct filter combinations before a full reset
+
+
+# Filter field names are fixed at import time; walking this tuple with
+# getattr is cheaper than model_dump's serializer machinery on every list call
+_FILTER_FIELDS = tuple(UserFilters.model_fields)
+
+
+def _filters_to_dict(filters: Optional[UserFilters]) -> Dict[str, Any]:
+    """Collect the non-None filter values as repository keyword filters."""
+    if filters is None:
+        return {}
+    return {
+        field: value
+        for field in _FILTER_FIELDS
+        if (value := getattr(filters, field)) is not None
+    }
+
+
+def _encode_cursor(created_at: datetime, id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque base64 cursor."""
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor back into a (created_at, id) pair."""
+    payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    # int() guards against forged cursors like {"id": "x"}, which would
+    # otherwise bind a string into the keyset row comparison
+    return datetime.fromisoformat(payload["created_at"]), int(payload["id"])
+
 
 class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
     """
@@ -36,11 +84,28 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
         super().__init__(
             repository=UserRepository(db),
             response_schema=UserResponse,
-            entity_name="User"
+            entity_name="User",
+            # Everything UserResponse reads (plus created_at for cursors);
+            # notably keeps hashed_password off the wire in list queries
+            response_columns=(User.email, User.username, User.is_active, User.created_at)
         )
 
     # Additional user-specific methods beyond base CRUD
-    
+
+    @staticmethod
+    def _to_response(user: User) -> UserResponse:
+        """
+        Build a UserResponse from a trusted ORM row.
+        Rows coming out of the database already satisfy the schema, so this
+        uses model_construct and skips re-validating every field.
+        """
+        return UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            is_active=user.is_active,
+        )
+
     def get_by_email(self, email: str) -> UserResponse:
         """Get user by email."""
         try:
@@ -49,8 +114,8 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
             user = self.repository.get_by_email(email)
             if not user:
                 raise UserNotFoundError(f"User with email {email} not found")
-            
-            return UserResponse.model_validate(user)
+
+            return self._to_response(user)
             
         except UserNotFoundError:
             raise
@@ -66,8 +131,8 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
             user = self.repository.get_by_username(username)
             if not user:
                 raise UserNotFoundError(f"User with username {username} not found")
-            
-            return UserResponse.model_validate(user)
+
+            return self._to_response(user)
             
         except UserNotFoundError:
             raise
@@ -80,10 +145,10 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
         try:
             self.logger.debug(f"Fetching user with tasks for ID: {user_id}")
             
-            user = self.repository.get(user_id)
+            user = self.repository.get_with_tasks(user_id)
             if not user:
                 raise UserNotFoundError(f"User with ID {user_id} not found")
-            
+
             return UserWithTasksResponse.model_validate(user)
             
         except UserNotFoundError:
@@ -98,64 +163,195 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
         filters: Optional[UserFilters] = None
     ) -> PaginatedResponse[UserResponse]:
         """Get users with pagination and optional filters."""
+        # get_paginated already logs failures and wraps them in ServiceError;
+        # a second try/except here only re-logged and double-prefixed the message
+        return super().get_paginated(pagination, **_filters_to_dict(filters))
+
+    def get_users_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        filters: Optional[UserFilters] = None
+    ) -> CursorPaginatedResponse[UserResponse]:
+        """Get users with keyset (cursor) pagination and optional filters."""
         try:
-            filter_dict = filters.model_dump(exclude_none=True) if filters else {}
-            return super().get_paginated(pagination, **filter_dict)
-            
+            keyset = None
+            if cursor:
+                try:
+                    keyset = _decode_cursor(cursor)
+                except (ValueError, KeyError, TypeError, json.JSONDecodeError):
+                    # TypeError covers decodable-but-forged payloads (wrong
+                    # JSON type, non-string created_at, non-mapping body)
+                    raise AppValidationError("Invalid pagination cursor")
+
+            filter_dict = _filters_to_dict(filters)
+
+            # Fetch one extra row to know whether another page exists
+            users = self.repository.get_with_cursor(
+                cursor=keyset, limit=limit + 1, columns=self.response_columns, **filter_dict
+            )
+            has_next = len(users) > limit
+            users = users[:limit]
+
+            next_cursor = None
+            if has_next and users:
+                last = users[-1]
+                next_cursor = _encode_cursor(last.created_at, last.id)
+
+            return CursorPaginatedResponse[UserResponse](
+                items=[UserResponse.model_validate(user) for user in users],
+                limit=limit,
+                next_cursor=next_cursor,
+                has_next=has_next
+            )
+
+        except AppValidationError:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching filtered paginated users: {str(e)}")
+            self.logger.error(f"Error fetching cursor-paginated users: {str(e)}")
             raise ServiceError(f"Failed to retrieve users: {str(e)}")
 
     def bulk_update_users(self, bulk_data: UserBulkUpdate) -> int:
         """Bulk update multiple users."""
         try:
             self.logger.info(f"Bulk updating {len(bulk_data.user_ids)} users")
-            
-            # Prepare updates
-            updates = []
-            update_dict = bulk_data.update_data.model_dump(exclude_none=True)
-            
-            for user_id in bulk_data.user_ids:
-                user_update = {'id': user_id, **update_dict}
-                user_update['updated_at'] = datetime.now(timezone.utc)
-                
-                # Hash password if provided
-                if 'password' in user_update:
-                    user_update['hashed_password'] = get_password_hash(user_update.pop('password'))
-                
-                updates.append(user_update)
-            
-            updated_count = self.repository.bulk_update(updates)
+
+            # Validate the whole ID batch at C speed instead of per-element
+            # checks: packing into an int64 array bounds-checks every ID, and
+            # min() is a single pass. Duplicates need no dedup here since they
+            # hit the same row in the single UPDATE ... WHERE id IN (...) below
+            try:
+                id_batch = array('q', bulk_data.user_ids)
+            except OverflowError:
+                raise AppValidationError("User IDs must fit in a 64-bit integer")
+            if min(id_batch) <= 0:
+                raise AppValidationError("User IDs must be positive integers")
+
+            # The update payload is identical for every user, so prepare it once,
+            # walking only the fields the client explicitly set; user_id is
+            # skipped because the target IDs come from user_ids, not the payload
+            update_dict = {
+                field: value
+                for field in bulk_data.update_data.model_fields_set
+                if field != 'user_id' and (value := getattr(bulk_data.update_data, field)) is not None
+            }
+            update_dict['updated_at'] = datetime.now(timezone.utc)
+
+            # Hash password if provided
+            if 'password' in update_dict:
+                update_dict['hashed_password'] = get_password_hash(update_dict.pop('password'))
+
+            # One UPDATE ... WHERE id IN (...) instead of one UPDATE per user
+            updated_count = self.repository.bulk_update_same(bulk_data.user_ids, update_dict)
+            _COUNT_CACHE.clear()
             self.logger.info(f"Bulk update completed: {updated_count} users updated")
             return updated_count
-            
+
+        except AppValidationError:
+            raise
         except Exception as e:
             self.logger.error(f"Error in bulk update: {str(e)}")
             raise ServiceError(f"Failed to bulk update users: {str(e)}")
 
-    def activate_user(self, user_id: int) -> UserResponse:
-        """Activate a user account."""
+    def update(self, entity_id: int, update_data: UserUpdate) -> UserResponse:
+        """Update a user with a single conditional UPDATE instead of separate SELECTs."""
         try:
-            self.logger.info(f"Activating user: {user_id}")
-            
-            update_data = UserUpdate(is_active=True)
-            return self.update(user_id, update_data)
-            
-        except Exception as e:
-            self.logger.error(f"Error activating user {user_id}: {str(e)}")
+            self.logger.info(f"Updating User with ID: {entity_id}")
+
+            if getattr(update_data, 'password', None):
+                self._validate_password_strength(update_data.password)
+
+            prepared_data = self._prepare_update_data(update_data)
+            prepared_data.pop('user_id', None)  # the target ID comes from entity_id
+
+            updated_user = self.repository.update_with_conflict_check(entity_id, prepared_data)
+            if updated_user is None:
+                self._raise_update_failure(entity_id, update_data)
+
+            _COUNT_CACHE.clear()
+            self.logger.info(f"User {entity_id} updated successfully")
+            return UserResponse.model_validate(updated_user)
+
+        except (NotFoundError, AppValidationError, DatabaseError):
             raise
+        except Exception as e:
+            self.logger.error(f"Error updating User {entity_id}: {str(e)}")
+            raise ServiceError(f"Failed to update User: {str(e)}")
+
+    def _raise_update_failure(self, entity_id: int, update_data: UserUpdate) -> None:
+        """Work out why the guarded UPDATE matched no row and raise accordingly."""
+        if not self.repository.exists(entity_id):
+            raise UserNotFoundError(f"User with ID {entity_id} not found")
+
+        # Probe the unique fields the client actually sent with one combined
+        # round-trip instead of one SELECT per field
+        fields_set = update_data.model_fields_set
+        email = update_data.email if 'email' in fields_set else None
+        username = update_data.username if 'username' in fields_set else None
+        if email or username:
+            email_taken, username_taken = self.repository.check_uniqueness(
+                email or '', username or '', exclude_id=entity_id
+            )
+            if email and email_taken:
+                raise UserAlreadyExistsError(f"User with email {email} already exists")
+            if username and username_taken:
+                raise UserAlreadyExistsError(f"User with username {username} already exists")
+
+        raise ServiceError(f"Failed to update User {entity_id}")
+
+    def _set_active(self, user_id: int, is_active: bool) -> UserResponse:
+        """
+        Flip the is_active flag with one guarded UPDATE. Building a UserUpdate
+        just to carry a boolean would run full schema validation per call (and
+        the schema does not even model is_active), so the payload dict goes
+        straight to the repository.
+        """
+        updated_user = self.repository.update_with_conflict_check(
+            user_id,
+            {'is_active': is_active, 'updated_at': datetime.now(timezone.utc)}
+        )
+        if updated_user is None:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
+        _COUNT_CACHE.clear()
+        return self._to_response(updated_user)
+
+    def activate_user(self, user_id: int) -> UserResponse:
+        """Activate a user account."""
+        self.logger.info(f"Activating user: {user_id}")
+        return self._set_active(user_id, True)
 
     def deactivate_user(self, user_id: int) -> UserResponse:
         """Deactivate a user account."""
-        try:
-            self.logger.info(f"Deactivating user: {user_id}")
-            
-            update_data = UserUpdate(is_active=False)
-            return self.update(user_id, update_data)
-            
-        except Exception as e:
-            self.logger.error(f"Error deactivating user {user_id}: {str(e)}")
-            raise
+        self.logger.info(f"Deactivating user: {user_id}")
+        return self._set_active(user_id, False)
+
+    def count(self, **filters) -> int:
+        """Count users with optional filters, cached for a few seconds."""
+        key = tuple(sorted(filters.items()))
+        now = time.monotonic()
+        cached = _COUNT_CACHE.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        total = super().count(**filters)
+        if len(_COUNT_CACHE) >= _COUNT_CACHE_MAX:
+            _COUNT_CACHE.clear()
+        _COUNT_CACHE[key] = (now + _COUNT_CACHE_TTL, total)
+        return total
+
+    def create(self, create_data: UserCreate) -> UserResponse:
+        """Create a user and invalidate cached counts and lookups."""
+        response = super().create(create_data)
+        _COUNT_CACHE.clear()
+        self.repository.clear_request_cache()
+        return response
+
+    def delete(self, entity_id: int) -> UserResponse:
+        """Delete a user and invalidate cached counts and lookups."""
+        response = super().delete(entity_id)
+        _COUNT_CACHE.clear()
+        self.repository.clear_request_cache()
+        return response
 
     # Utility methods
     def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
@@ -170,7 +366,7 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
         """Get all active users."""
         try:
             active_users = self.repository.get_active_users()
-            return [UserResponse.model_validate(user) for user in active_users]
+            return [self._to_response(user) for user in active_users]
         except Exception as e:
             self.logger.error(f"Error fetching active users: {str(e)}")
             raise ServiceError(f"Failed to retrieve active users: {str(e)}")
@@ -179,32 +375,22 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
 
     def _validate_before_create(self, create_data: UserCreate) -> None:
         """Custom validation before user creation."""
-        # Check email uniqueness
-        if self.email_exists(create_data.email):
+        # Check email and username uniqueness with a single round-trip
+        email_taken, username_taken = self.repository.check_uniqueness(
+            create_data.email, create_data.username
+        )
+        if email_taken:
             raise UserAlreadyExistsError(f"User with email {create_data.email} already exists")
-        
-        # Check username uniqueness
-        if self.username_exists(create_data.username):
+        if username_taken:
             raise UserAlreadyExistsError(f"User with username {create_data.username} already exists")
-        
+
         # Add any additional user-specific validation here
         self._validate_password_strength(create_data.password)
 
-    def _validate_before_update(self, entity_id: int, update_data: UserUpdate) -> None:
-        """Custom validation before user update."""
-        # Check email uniqueness (excluding current user)
-        if hasattr(update_data, 'email') and update_data.email:
-            if self.email_exists(update_data.email, exclude_id=entity_id):
-                raise UserAlreadyExistsError(f"User with email {update_data.email} already exists")
-        
-        # Check username uniqueness (excluding current user)
-        if hasattr(update_data, 'username') and update_data.username:
-            if self.username_exists(update_data.username, exclude_id=entity_id):
-                raise UserAlreadyExistsError(f"User with username {update_data.username} already exists")
-        
-        # Validate password if being updated
-        if hasattr(update_data, 'password') and update_data.password:
-            self._validate_password_strength(update_data.password)
+    # No _validate_before_update override: UserService.update bypasses
+    # BaseService.update, and the guarded UPDATE does the uniqueness checking
+    # in-statement, with _raise_update_failure discriminating conflicts after
+    # the fact. Password strength is validated in update() itself.
 
     def _validate_before_delete(self, entity_id: int) -> None:
         """Custom validation before user deletion."""
@@ -213,7 +399,7 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserResponse]):
         user = self._get_entity_or_raise(entity_id)
         
         # Example: Prevent deletion of admin users
-        if hasattr(user, 'is_admin') and user.is_admin:
+        if _HAS_IS_ADMIN and user.is_admin:
             raise AppValidationError("Cannot delete admin users")
 
     def _prepare_create_data(self, create_data: UserCreate) -> Dict[str, Any]:
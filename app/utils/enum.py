@@ -1,6 +1,6 @@
 import enum
 
-class PriorityEnum(enum.Enum):
+class PriorityEnum(str, enum.Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
@@ -12,7 +12,7 @@ class TaskStatus(str, enum.Enum):
     COMPLETED = "completed"
     CANCELLED = "cancelled"
     
-class TagColorEnum(enum.Enum):
+class TagColorEnum(str, enum.Enum):
     BLUE = "#007bff"
     RED = "#dc3545"
     GREEN = "#28a745"
@@ -2,270 +2,222 @@
 Reusable response documentation templates for OpenAPI/Swagger.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from app.schemas.common import ErrorResponseSchema
 
 
+def _example(summary: str, error: str, code: int, detail: str,
+             error_type: str, field: Optional[str] = None):
+    """One named example node for an error response body."""
+    value = {"error": error, "code": code, "detail": detail, "error_type": error_type}
+    if field is not None:
+        value["field"] = field
+    return {"summary": summary, "value": value}
+
+
+def _error_template(description: str, examples: dict):
+    """Outer scaffolding shared by every error response template."""
+    return {
+        "description": description,
+        "model": ErrorResponseSchema,
+        "content": {"application/json": {"examples": examples}},
+    }
+
+
+# The fixed-status templates carry no per-route data, so they are built a
+# single time at import and shared by reference; the staticmethods below just
+# hand back these constants.
+
+_VALIDATION_ERROR_400 = _error_template("Validation error", {
+    "field_validation": _example(
+        "Field validation failed",
+        "Validation Error", 400, "Field validation failed", "AppValidationError",
+        field="field_name",
+    ),
+    "business_rule": _example(
+        "Business rule violation",
+        "Validation Error", 400, "Business rule validation failed", "AppValidationError",
+    ),
+})
+
+_UNAUTHORIZED_401 = _error_template("Authentication failed", {
+    "invalid_credentials": _example(
+        "Invalid credentials",
+        "Authentication Failed", 401, "Invalid credentials provided", "InvalidCredentialsError",
+    ),
+    "token_expired": _example(
+        "Token expired",
+        "Authentication Failed", 401, "Access token has expired", "TokenExpiredError",
+    ),
+})
+
+_FORBIDDEN_403 = _error_template("Access forbidden", {
+    "insufficient_permissions": _example(
+        "Insufficient permissions",
+        "Access Forbidden", 403, "Insufficient permissions to access this resource", "AuthorizationError",
+    ),
+    "account_inactive": _example(
+        "Account inactive",
+        "Access Forbidden", 403, "User account is inactive", "UserInactiveError",
+    ),
+})
+
+_UNPROCESSABLE_ENTITY_422 = _error_template("Request validation error", {
+    "pydantic_validation": _example(
+        "Pydantic validation failed",
+        "Validation Error", 422, "Invalid input data", "ValidationError",
+        field="field_name",
+    ),
+    "type_error": _example(
+        "Type conversion error",
+        "Validation Error", 422, "Invalid data type", "ValidationError",
+        field="field_name",
+    ),
+})
+
+_INTERNAL_SERVER_ERROR_500 = _error_template("Internal server error", {
+    "database_error": _example(
+        "Database error",
+        "Database Error", 500, "A database error occurred", "DatabaseError",
+    ),
+    "service_error": _example(
+        "Service error",
+        "Service Error", 500, "An internal service error occurred", "ServiceError",
+    ),
+    "unexpected_error": _example(
+        "Unexpected error",
+        "Internal Server Error", 500, "An unexpected error occurred", "InternalServerError",
+    ),
+})
+
+# Skeletons for the parameterized templates: only the "{resource}" slots vary
+# per call, so the shape is declared once and filled by a single substitution
+# pass on first use per resource name (results are memoized on the factories).
+
+_NOT_FOUND_404_TEMPLATE = _error_template("{resource} not found", {
+    "resource_not_found": _example(
+        "{resource} does not exist",
+        "Not Found", 404, "{resource} not found", "NotFoundError",
+    ),
+    "resource_deleted": _example(
+        "{resource} was deleted",
+        "Not Found", 404, "{resource} not found", "NotFoundError",
+    ),
+})
+
+_CONFLICT_409_TEMPLATE = _error_template("{resource} already exists", {
+    "resource_exists": _example(
+        "{resource} already exists",
+        "{resource} Already Exists", 409,
+        "{resource} with this identifier already exists", "{resource}AlreadyExistsError",
+    ),
+})
+
+
+# Flat status -> template registry for the fixed-status responses;
+# standard_responses reads from here instead of dispatching through the
+# staticmethods one by one
+_FIXED_RESPONSES = {
+    400: _VALIDATION_ERROR_400,
+    401: _UNAUTHORIZED_401,
+    403: _FORBIDDEN_403,
+    422: _UNPROCESSABLE_ENTITY_422,
+    500: _INTERNAL_SERVER_ERROR_500,
+}
+
+
+def _fill_resource(template, resource_name: str):
+    """Copy a template skeleton, substituting "{resource}" in string leaves."""
+    if isinstance(template, dict):
+        return {key: _fill_resource(value, resource_name) for key, value in template.items()}
+    if isinstance(template, str):
+        return template.replace("{resource}", resource_name)
+    return template
+
+
 class ResponseDocs:
-    """Standard response documentation templates."""
+    """
+    Standard response documentation templates.
+
+    The fixed-status templates are module-level constants shared across
+    routes; the parameterized factories are pure functions of hashable
+    arguments, called once per route decorator at import time, and memoized
+    so routes sharing a template get the same dict instead of a fresh literal.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def success_200(model, description: str = "Operation successful"):
         """Standard 200 success response."""
         return {
             "description": description,
             "model": model,
-            
         }
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def created_201(model, description: str = "Resource created successfully"):
         """Standard 201 created response."""
         return {
             "description": description,
             "model": model,
-          
         }
 
     @staticmethod
     def validation_error_400():
         """Standard 400 validation error response."""
-        return {
-            "description": "Validation error",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "field_validation": {
-                            "summary": "Field validation failed",
-                            "value": {
-                                "error": "Validation Error",
-                                "code": 400,
-                                "detail": "Field validation failed",
-                                "error_type": "AppValidationError",
-                                "field": "field_name"
-                            }
-                        },
-                        "business_rule": {
-                            "summary": "Business rule violation",
-                            "value": {
-                                "error": "Validation Error",
-                                "code": 400,
-                                "detail": "Business rule validation failed",
-                                "error_type": "AppValidationError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _VALIDATION_ERROR_400
 
     @staticmethod
     def unauthorized_401():
         """Standard 401 unauthorized response."""
-        return {
-            "description": "Authentication failed",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "invalid_credentials": {
-                            "summary": "Invalid credentials",
-                            "value": {
-                                "error": "Authentication Failed",
-                                "code": 401,
-                                "detail": "Invalid credentials provided",
-                                "error_type": "InvalidCredentialsError"
-                            }
-                        },
-                        "token_expired": {
-                            "summary": "Token expired",
-                            "value": {
-                                "error": "Authentication Failed",
-                                "code": 401,
-                                "detail": "Access token has expired",
-                                "error_type": "TokenExpiredError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _UNAUTHORIZED_401
 
     @staticmethod
     def forbidden_403():
         """Standard 403 forbidden response."""
-        return {
-            "description": "Access forbidden",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "insufficient_permissions": {
-                            "summary": "Insufficient permissions",
-                            "value": {
-                                "error": "Access Forbidden",
-                                "code": 403,
-                                "detail": "Insufficient permissions to access this resource",
-                                "error_type": "AuthorizationError"
-                            }
-                        },
-                        "account_inactive": {
-                            "summary": "Account inactive",
-                            "value": {
-                                "error": "Access Forbidden",
-                                "code": 403,
-                                "detail": "User account is inactive",
-                                "error_type": "UserInactiveError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _FORBIDDEN_403
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def not_found_404(resource_name: str = "Resource"):
         """Standard 404 not found response."""
-        return {
-            "description": f"{resource_name} not found",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "resource_not_found": {
-                            "summary": f"{resource_name} does not exist",
-                            "value": {
-                                "error": "Not Found",
-                                "code": 404,
-                                "detail": f"{resource_name} not found",
-                                "error_type": "NotFoundError"
-                            }
-                        },
-                        "resource_deleted": {
-                            "summary": f"{resource_name} was deleted",
-                            "value": {
-                                "error": "Not Found",
-                                "code": 404,
-                                "detail": f"{resource_name} not found",
-                                "error_type": "NotFoundError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _fill_resource(_NOT_FOUND_404_TEMPLATE, resource_name)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def conflict_409(resource_name: str = "Resource"):
         """Standard 409 conflict response."""
-        return {
-            "description": f"{resource_name} already exists",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "resource_exists": {
-                            "summary": f"{resource_name} already exists",
-                            "value": {
-                                "error": f"{resource_name} Already Exists",
-                                "code": 409,
-                                "detail": f"{resource_name} with this identifier already exists",
-                                "error_type": f"{resource_name}AlreadyExistsError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _fill_resource(_CONFLICT_409_TEMPLATE, resource_name)
 
     @staticmethod
     def unprocessable_entity_422():
         """Standard 422 validation error response."""
-        return {
-            "description": "Request validation error",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "pydantic_validation": {
-                            "summary": "Pydantic validation failed",
-                            "value": {
-                                "error": "Validation Error",
-                                "code": 422,
-                                "detail": "Invalid input data",
-                                "error_type": "ValidationError",
-                                "field": "field_name"
-                            }
-                        },
-                        "type_error": {
-                            "summary": "Type conversion error",
-                            "value": {
-                                "error": "Validation Error",
-                                "code": 422,
-                                "detail": "Invalid data type",
-                                "error_type": "ValidationError",
-                                "field": "field_name"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _UNPROCESSABLE_ENTITY_422
 
     @staticmethod
     def internal_server_error_500():
         """Standard 500 internal server error response."""
-        return {
-            "description": "Internal server error",
-            "model": ErrorResponseSchema,
-            "content": {
-                "application/json": {
-                    "examples": {
-                        "database_error": {
-                            "summary": "Database error",
-                            "value": {
-                                "error": "Database Error",
-                                "code": 500,
-                                "detail": "A database error occurred",
-                                "error_type": "DatabaseError"
-                            }
-                        },
-                        "service_error": {
-                            "summary": "Service error",
-                            "value": {
-                                "error": "Service Error",
-                                "code": 500,
-                                "detail": "An internal service error occurred",
-                                "error_type": "ServiceError"
-                            }
-                        },
-                        "unexpected_error": {
-                            "summary": "Unexpected error",
-                            "value": {
-                                "error": "Internal Server Error",
-                                "code": 500,
-                                "detail": "An unexpected error occurred",
-                                "error_type": "InternalServerError"
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _INTERNAL_SERVER_ERROR_500
 
     @classmethod
+    @lru_cache(maxsize=None)
     def standard_responses(cls, include_auth: bool = True, resource_name: str = "Resource"):
         """Get standard response documentation set."""
         responses = {
             404: cls.not_found_404(resource_name),
-            422: cls.unprocessable_entity_422(),
-            500: cls.internal_server_error_500(),
+            422: _FIXED_RESPONSES[422],
+            500: _FIXED_RESPONSES[500],
         }
-        
+
         if include_auth:
-            responses.update({
-                401: cls.unauthorized_401(),
-                403: cls.forbidden_403(),
-            })
-        
-        return responses
\ No newline at end of file
+            # Single dict display instead of a second literal plus .update()
+            return {
+                **responses,
+                401: _FIXED_RESPONSES[401],
+                403: _FIXED_RESPONSES[403],
+            }
+
+        return responses